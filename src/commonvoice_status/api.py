@@ -1,10 +1,14 @@
 """Common Voice API client with local caching."""
 
+import http.client
 import json
 import os
+import queue
 import time
+import urllib.parse
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 API_URL = "https://commonvoice.mozilla.org/api/v1/stats/languages"
@@ -72,3 +76,129 @@ def get_language_by_locale(languages, locale_code):
         if lang.get("locale") == locale_code:
             return lang
     return None
+
+
+# Per-locale detail endpoints: name -> (path template, cache TTL in seconds)
+API_BASE = "https://commonvoice.mozilla.org"
+DETAIL_ENDPOINTS = {
+    "clips_today": ("/api/v1/{locale}/clips/daily_count", 600),
+    "votes_today": ("/api/v1/{locale}/clips/votes/daily_count", 600),
+    "activity": ("/api/v1/{locale}/contribution_activity?from=everyone", 3600),
+}
+DETAIL_CACHE_DIR = CACHE_DIR / "details"
+DETAIL_WORKERS = 4
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections to a single host, shared between threads."""
+
+    def __init__(self, base_url=None, size=DETAIL_WORKERS, timeout=15):
+        parts = urllib.parse.urlsplit(base_url or API_BASE)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def _new_connection(self):
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, conn):
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def get_json(self, path):
+        """GET path and decode JSON, retrying once if a pooled connection went stale."""
+        for attempt in range(2):
+            # Other idle connections may be stale too, so retry on a new one
+            conn = self._new_connection() if attempt else self._acquire()
+            try:
+                conn.request("GET", path, headers={"User-Agent": "CommonVoiceStatus/0.1"})
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            if resp.status != 200:
+                raise RuntimeError(f"HTTP {resp.status} for {path}")
+            return json.loads(body.decode())
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _detail_cache_file(locale_code, name):
+    return DETAIL_CACHE_DIR / f"{locale_code}-{name}.json"
+
+
+def _read_detail_cache(locale_code, name):
+    """Read a cached detail result if it is within that endpoint's TTL."""
+    path = _detail_cache_file(locale_code, name)
+    try:
+        if time.time() - path.stat().st_mtime > DETAIL_ENDPOINTS[name][1]:
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_detail_cache(locale_code, name, data):
+    DETAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(_detail_cache_file(locale_code, name), "w") as f:
+        json.dump(data, f)
+
+
+def fetch_locale_details(locale_codes, on_result=None, force_refresh=False, pool=None):
+    """Fetch detail endpoints for several locales in parallel.
+
+    on_result(locale, name, data) is called from a worker thread as soon as
+    each result is available; data is None if that endpoint failed.
+    Returns {locale: {name: data}}.
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = ConnectionPool()
+    results = {code: {} for code in locale_codes}
+
+    def fetch_one(locale_code, name):
+        data = None if force_refresh else _read_detail_cache(locale_code, name)
+        if data is None:
+            path = DETAIL_ENDPOINTS[name][0].format(locale=urllib.parse.quote(locale_code))
+            try:
+                data = pool.get_json(path)
+                _write_detail_cache(locale_code, name, data)
+            except (RuntimeError, OSError, http.client.HTTPException, ValueError):
+                data = None
+        results[locale_code][name] = data
+        if on_result is not None:
+            on_result(locale_code, name, data)
+
+    try:
+        with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+            for locale_code in locale_codes:
+                for name in DETAIL_ENDPOINTS:
+                    executor.submit(fetch_one, locale_code, name)
+    finally:
+        if own_pool:
+            pool.close()
+    return results
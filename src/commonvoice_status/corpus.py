@@ -0,0 +1,283 @@
+"""Per-locale statistics computed from a downloaded Common Voice corpus.
+
+A corpus release has one directory per locale with validated.tsv,
+invalidated.tsv, other.tsv and clip_durations.tsv. The result has the
+same shape as the stats API, so the windows and exports can use it
+unchanged:
+
+    python -m commonvoice_status.corpus ~/cv-corpus-20.0-2024-12-06
+
+One figure differs: sentencesCount is the number of distinct
+sentences with at least one validated clip, whereas the API counts the
+sentences available for recording.
+
+Rows of clip_durations.tsv with a missing or non-numeric duration are
+skipped, like rows with too few columns.
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import math
+import multiprocessing
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from . import api
+from .api import CACHE_DIR
+
+CORPUS_CACHE_DIR = CACHE_DIR / "corpus"
+CHUNK_ROWS = 50_000
+# Clip durations held in memory at once; bigger locales take several passes
+MAX_JOIN_ENTRIES = 2_000_000
+# Distinct values counted exactly before switching to an estimate
+MAX_EXACT_DISTINCT = 500_000
+# Rough bytes per row of clip_durations.tsv, used to plan the passes
+_DURATION_ROW_BYTES = 45
+
+_CLIP_FILES = ["validated.tsv", "invalidated.tsv", "other.tsv"]
+_INPUT_FILES = _CLIP_FILES + ["clip_durations.tsv"]
+
+csv.field_size_limit(sys.maxsize)
+
+
+class _DistinctCounter:
+    """Count distinct strings exactly up to a limit, then with HyperLogLog.
+
+    Exact mode keeps 64-bit digests rather than the strings themselves;
+    HyperLogLog mode uses a fixed 16 KiB of registers (about 1% error).
+    """
+
+    _P = 14
+
+    def __init__(self, limit=MAX_EXACT_DISTINCT):
+        self.limit = limit
+        self._exact = set()
+        self._registers = None
+
+    def add(self, value):
+        h = int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+        if self._registers is None:
+            self._exact.add(h)
+            if len(self._exact) > self.limit:
+                self._registers = bytearray(1 << self._P)
+                for old in self._exact:
+                    self._add_hll(old)
+                self._exact = None
+        else:
+            self._add_hll(h)
+
+    def _add_hll(self, h):
+        index = h >> (64 - self._P)
+        rest = h & ((1 << (64 - self._P)) - 1)
+        rank = (64 - self._P) - rest.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def __len__(self):
+        if self._registers is None:
+            return len(self._exact)
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+def _iter_chunks(path, columns):
+    """Yield lists of tuples holding the named columns, CHUNK_ROWS at a time."""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
+        try:
+            header = next(reader)
+        except StopIteration:
+            return
+        indexes = [header.index(c) if c in header else None for c in columns]
+        width = max((i for i in indexes if i is not None), default=-1)
+        while True:
+            chunk = list(itertools.islice(reader, CHUNK_ROWS))
+            if not chunk:
+                return
+            yield [tuple(row[i] if i is not None else "" for i in indexes)
+                   for row in chunk if len(row) > width]
+
+
+def _partition(clip, passes):
+    return zlib.crc32(clip.encode()) % passes
+
+
+def _ingest_locale(locale_dir):
+    """Compute API-style statistics for one locale directory."""
+    locale_dir = Path(locale_dir)
+    durations_file = locale_dir / "clip_durations.tsv"
+    passes = 1
+    if durations_file.exists():
+        rows = durations_file.stat().st_size / _DURATION_ROW_BYTES
+        passes = max(1, math.ceil(rows / MAX_JOIN_ENTRIES))
+
+    speakers = _DistinctCounter()
+    sentences = _DistinctCounter()
+    ms = {"recorded": 0, "validated.tsv": 0, "invalidated.tsv": 0}
+
+    for p in range(passes):
+        durations = {}
+        if durations_file.exists():
+            for chunk in _iter_chunks(durations_file, ["clip", "duration[ms]"]):
+                for clip, duration in chunk:
+                    try:
+                        duration = int(duration)
+                    except ValueError:
+                        continue
+                    if p == 0:
+                        ms["recorded"] += duration
+                    if _partition(clip, passes) == p:
+                        durations[clip] = duration
+
+        for name in _CLIP_FILES:
+            path = locale_dir / name
+            if not path.exists():
+                continue
+            # Speakers and sentences only need one look at each row
+            if p == 0:
+                for chunk in _iter_chunks(path, ["client_id", "path", "sentence"]):
+                    for client_id, clip, sentence in chunk:
+                        speakers.add(client_id)
+                        if name == "validated.tsv":
+                            sentences.add(sentence)
+                        if name in ms and _partition(clip, passes) == 0:
+                            ms[name] += durations.get(clip, 0)
+            elif name in ms:
+                for chunk in _iter_chunks(path, ["path"]):
+                    for (clip,) in chunk:
+                        if _partition(clip, passes) == p:
+                            ms[name] += durations.get(clip, 0)
+        del durations
+
+    return {
+        "locale": locale_dir.name,
+        "english_name": locale_dir.name,
+        "recordedHours": ms["recorded"] / 3_600_000,
+        "validatedHours": ms["validated.tsv"] / 3_600_000,
+        "invalidatedHours": ms["invalidated.tsv"] / 3_600_000,
+        "speakersCount": len(speakers),
+        "sentencesCount": {"currentCount": len(sentences)},
+    }
+
+
+def _cache_key(locale_dir):
+    key = {}
+    for name in _INPUT_FILES:
+        path = locale_dir / name
+        if path.exists():
+            st = path.stat()
+            key[name] = [st.st_size, st.st_mtime_ns]
+    return key
+
+
+def _corpus_cache_file(locale_dir):
+    # Several releases on disk must not share one cache entry per locale
+    corpus_hash = hashlib.sha1(str(locale_dir.parent.resolve()).encode()).hexdigest()[:12]
+    return CORPUS_CACHE_DIR / f"{locale_dir.name}-{corpus_hash}.json"
+
+
+def _read_corpus_cache(locale_dir, key):
+    try:
+        with open(_corpus_cache_file(locale_dir), "r") as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if cached.get("path") != str(locale_dir.resolve()) or cached.get("key") != key:
+        return None
+    return cached.get("stats")
+
+
+def _write_corpus_cache(locale_dir, key, stats):
+    CORPUS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(_corpus_cache_file(locale_dir), "w") as f:
+        json.dump({"path": str(locale_dir.resolve()), "key": key, "stats": stats}, f)
+
+
+def _api_language_names():
+    """Map locale to English name from the last API download, however old."""
+    try:
+        with open(api.CACHE_FILE, "r") as f:
+            languages = json.load(f)
+        return {l["locale"]: l["english_name"] for l in languages
+                if l.get("locale") and l.get("english_name")}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def find_locales(corpus_dir):
+    """Return the locale directories of a corpus release."""
+    return sorted(p for p in Path(corpus_dir).iterdir()
+                  if p.is_dir() and (p / "validated.tsv").exists())
+
+
+def ingest_corpus(corpus_dir, workers=None, on_result=None):
+    """Compute statistics for every locale in corpus_dir. Returns list of dicts.
+
+    Locales whose files are unchanged (same size and mtime) come from the
+    cache; the rest are parsed in a process pool. Names come from the
+    cached API list when there is one. on_result(stats) is called as
+    each locale finishes.
+    """
+    locale_dirs = find_locales(corpus_dir)
+    if not locale_dirs:
+        raise RuntimeError(f"No Common Voice locales found in {corpus_dir}")
+
+    names = _api_language_names()
+
+    def named(stats):
+        return dict(stats, english_name=names.get(stats["locale"], stats["english_name"]))
+
+    results = []
+    pending = {}
+    for locale_dir in locale_dirs:
+        key = _cache_key(locale_dir)
+        stats = _read_corpus_cache(locale_dir, key)
+        if stats is not None:
+            stats = named(stats)
+            results.append(stats)
+            if on_result is not None:
+                on_result(stats)
+        else:
+            pending[locale_dir] = key
+
+    if pending:
+        # spawn, not fork: the GUI calls this from a thread
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = {executor.submit(_ingest_locale, d): d for d in pending}
+            for future in as_completed(futures):
+                locale_dir = futures[future]
+                stats = future.result()
+                _write_corpus_cache(locale_dir, pending[locale_dir], stats)
+                stats = named(stats)
+                results.append(stats)
+                if on_result is not None:
+                    on_result(stats)
+
+    results.sort(key=lambda l: l["locale"])
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute Common Voice statistics from a local corpus")
+    parser.add_argument("corpus_dir", help="directory with one subdirectory per locale")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    json.dump(ingest_corpus(args.corpus_dir, workers=args.workers), sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""Fullscreen wall-display window that rotates between views."""
+
+from datetime import datetime as _dt_now
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+
+from gi.repository import Adw, Gtk, GLib, Pango
+
+from .api import next_milestone
+from .model import DEFAULT_LOCALE
+from .window import _cv_heatmap_class, _detail_labels, _format_detail, _setup_heatmap_css
+from .i18n import _
+
+KIOSK_VIEWS = ["featured", "comparison", "ranking", "gap"]
+ROTATE_SECONDS = 20
+RANKING_SIZE = 32
+
+
+class _Tile(Gtk.Box):
+    """Heatmap tile whose labels are updated in place on refresh."""
+
+    def __init__(self):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=4,
+                         margin_start=6, margin_end=6, margin_top=6, margin_bottom=6)
+        self._css_class = None
+        self.name_lbl = Gtk.Label(ellipsize=Pango.EllipsizeMode.END, margin_top=12,
+                                  margin_start=8, margin_end=8)
+        self.name_lbl.add_css_class("title-3")
+        self.value_lbl = Gtk.Label()
+        self.value_lbl.add_css_class("title-1")
+        self.extra_lbl = Gtk.Label(margin_bottom=12)
+        self.append(self.name_lbl)
+        self.append(self.value_lbl)
+        self.append(self.extra_lbl)
+
+    def update(self, title, value, extra, css_class):
+        self.name_lbl.set_label(title)
+        self.value_lbl.set_label(value)
+        self.extra_lbl.set_label(extra)
+        if css_class != self._css_class:
+            if self._css_class:
+                self.remove_css_class(self._css_class)
+            self.add_css_class(css_class)
+            self._css_class = css_class
+
+
+class KioskWindow(Adw.ApplicationWindow):
+    """Chrome-less fullscreen window fed by the application's shared model.
+
+    Every view is built once; refreshes only change label text, so any
+    number of kiosk windows can follow one model cheaply.
+    """
+
+    def __init__(self, model, monitor=None, start_view=0, **kwargs):
+        super().__init__(**kwargs)
+        self.set_title(_("Common Voice Status"))
+        self.set_decorated(False)
+        self.set_cursor_from_name("none")
+
+        self.model = model
+        self._view_index = start_view % len(KIOSK_VIEWS)
+        self._facts = {}
+        self._detail_values = {}
+        self._compare_tiles = []
+        self._last_updated = None
+
+        _setup_heatmap_css()
+        self._build_ui()
+        self._model_handlers = [
+            model.connect("changed", self._on_model_changed),
+            model.connect("detail-changed", self._on_detail_changed),
+            model.connect("error", self._on_model_error),
+        ]
+        self._rotate_source = GLib.timeout_add_seconds(ROTATE_SECONDS, self._rotate)
+        self.connect("destroy", self._on_destroy)
+
+        if monitor is not None:
+            self.fullscreen_on_monitor(monitor)
+        else:
+            self.fullscreen()
+        if model.languages:
+            self._on_model_changed(model)
+
+    def _on_destroy(self, _win):
+        GLib.source_remove(self._rotate_source)
+        for handler in self._model_handlers:
+            self.model.disconnect(handler)
+        self._model_handlers = []
+
+    def _build_ui(self):
+        self.stack = Gtk.Stack(transition_type=Gtk.StackTransitionType.CROSSFADE,
+                               transition_duration=800)
+
+        spinner = Gtk.Spinner(spinning=True, width_request=64, height_request=64,
+                              halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER)
+        self.stack.add_named(spinner, "loading")
+
+        self.error_status = Adw.StatusPage(icon_name="dialog-error-symbolic",
+                                           title=_("Failed to load data"))
+        self.stack.add_named(self.error_status, "error")
+
+        self.stack.add_named(self._build_featured(), "featured")
+        self.stack.add_named(self._build_comparison(), "comparison")
+        self.stack.add_named(self._build_ranking(), "ranking")
+        self.stack.add_named(self._build_gap(), "gap")
+
+        # Shown over the last good data when a later refresh fails
+        self._stale_label = Gtk.Label(halign=Gtk.Align.END, valign=Gtk.Align.END,
+                                      margin_end=24, margin_bottom=24, visible=False)
+        self._stale_label.add_css_class("osd")
+        self._stale_label.add_css_class("title-4")
+
+        overlay = Gtk.Overlay(child=self.stack)
+        overlay.add_overlay(self._stale_label)
+        self.set_content(overlay)
+        self.stack.set_visible_child_name("loading")
+
+    def _page(self, title):
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=24, margin_start=48,
+                      margin_end=48, margin_top=32, margin_bottom=32)
+        label = Gtk.Label(label=title, xalign=0)
+        label.add_css_class("title-1")
+        box.append(label)
+        return box, label
+
+    def _build_featured(self):
+        box, self._featured_title = self._page("")
+        grid = Gtk.Grid(column_spacing=48, row_spacing=16, vexpand=True, valign=Gtk.Align.CENTER)
+        facts = [
+            ("recorded", _("Recorded hours")),
+            ("validated", _("Validated hours")),
+            ("invalidated", _("Invalidated hours")),
+            ("speakers", _("Speakers")),
+            ("sentences", _("Sentences")),
+        ]
+        rows = [(key, label, self._facts) for key, label in facts] + \
+            [(key, label, self._detail_values) for key, label in _detail_labels().items()]
+        for i, (key, label, target) in enumerate(rows):
+            caption = Gtk.Label(label=label, xalign=0)
+            caption.add_css_class("title-2")
+            value = Gtk.Label(label="…", xalign=1)
+            value.add_css_class("title-1")
+            grid.attach(caption, 0, i, 1, 1)
+            grid.attach(value, 1, i, 1, 1)
+            target[key] = value
+        box.append(grid)
+        return box
+
+    def _build_comparison(self):
+        box, _label = self._page(_("Nordic Comparison"))
+        self._compare_flow = Gtk.FlowBox(selection_mode=Gtk.SelectionMode.NONE, homogeneous=True,
+                                         min_children_per_line=3, max_children_per_line=6,
+                                         vexpand=True, valign=Gtk.Align.CENTER)
+        box.append(self._compare_flow)
+        return box
+
+    def _build_ranking(self):
+        box, _label = self._page(_("All Languages") + " — " + _("Sorted by validated hours"))
+        flow = Gtk.FlowBox(selection_mode=Gtk.SelectionMode.NONE, homogeneous=True,
+                           min_children_per_line=4, max_children_per_line=8, vexpand=True)
+        self._ranking_tiles = []
+        for _i in range(RANKING_SIZE):
+            tile = _Tile()
+            self._ranking_tiles.append(tile)
+            flow.append(tile)
+        box.append(flow)
+        return box
+
+    def _build_gap(self):
+        box, _label = self._page(_("Gap Analysis"))
+        inner = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=24, vexpand=True,
+                        valign=Gtk.Align.CENTER)
+        self._gap_title = Gtk.Label()
+        self._gap_title.add_css_class("title-1")
+        self._gap_progress = Gtk.ProgressBar()
+        self._gap_subtitle = Gtk.Label()
+        self._gap_subtitle.add_css_class("title-2")
+        inner.append(self._gap_title)
+        inner.append(self._gap_progress)
+        inner.append(self._gap_subtitle)
+        box.append(inner)
+        return box
+
+    def _on_model_changed(self, model):
+        selected = model.selected_language(DEFAULT_LOCALE)
+        if selected:
+            self._update_featured(selected)
+            self._update_gap(selected)
+        self._update_comparison(model.comparison_languages())
+        ranked = sorted(model.languages, key=lambda l: l.get("validatedHours", 0), reverse=True)
+        self._update_ranking(ranked)
+        self._last_updated = _dt_now.now()
+        self._stale_label.set_visible(False)
+        if self.stack.get_visible_child_name() in ("loading", "error"):
+            self.stack.set_visible_child_name(KIOSK_VIEWS[self._view_index])
+
+    def _on_model_error(self, model, message):
+        if self._last_updated is None:
+            self.error_status.set_description(message)
+            self.stack.set_visible_child_name("error")
+            return
+        self._stale_label.set_label(_("Data from {} — refresh failed: {}").format(
+            self._last_updated.strftime("%Y-%m-%d %H:%M"), message))
+        self._stale_label.set_visible(True)
+
+    def _on_detail_changed(self, model, locale_code, name):
+        selected = model.selected_language(DEFAULT_LOCALE)
+        if selected and selected.get("locale") == locale_code and name in self._detail_values:
+            self._detail_values[name].set_label(_format_detail(name, model.details[locale_code][name]))
+
+    def _update_featured(self, lang):
+        self._featured_title.set_label(lang.get("english_name", lang.get("locale", "?")))
+        self._facts["recorded"].set_label(f"{lang.get('recordedHours', 0):,.0f}")
+        self._facts["validated"].set_label(f"{lang.get('validatedHours', 0):,.0f}")
+        self._facts["invalidated"].set_label(f"{lang.get('invalidatedHours', 0):,.1f}")
+        self._facts["speakers"].set_label(f"{lang.get('speakersCount', 0):,}")
+        self._facts["sentences"].set_label(f"{lang.get('sentencesCount', {}).get('currentCount', 0):,}")
+        locale_details = self.model.details.get(lang.get("locale"), {})
+        for name, label in self._detail_values.items():
+            if name in locale_details:
+                label.set_label(_format_detail(name, locale_details[name]))
+
+    def _update_gap(self, lang):
+        validated = lang.get("validatedHours", 0)
+        milestone, remaining = next_milestone(validated)
+        if milestone is None:
+            self._gap_title.set_label(_("All milestones reached"))
+            self._gap_progress.set_fraction(1.0)
+            self._gap_subtitle.set_label("")
+            return
+        pct = (validated / milestone) * 100
+        self._gap_title.set_label(_("Next milestone: {} hours").format(f"{milestone:,}"))
+        self._gap_progress.set_fraction(pct / 100)
+        self._gap_subtitle.set_label(
+            _("{:.0f} hours remaining ({:.1f}% complete)").format(remaining, pct))
+
+    def _update_comparison(self, found):
+        # Only add or remove tiles when the number of languages changes
+        while len(self._compare_tiles) < len(found):
+            tile = _Tile()
+            self._compare_tiles.append(tile)
+            self._compare_flow.append(tile)
+        while len(self._compare_tiles) > len(found):
+            self._compare_flow.remove(self._compare_tiles.pop())
+        for tile, lang in zip(self._compare_tiles, found):
+            validated = lang.get("validatedHours", 0)
+            tile.update(lang.get("english_name", lang.get("locale", "?")),
+                        f"{validated:,.0f}h",
+                        f"{lang.get('speakersCount', 0):,} speakers",
+                        _cv_heatmap_class(validated))
+
+    def _update_ranking(self, ranked):
+        for i, tile in enumerate(self._ranking_tiles):
+            if i >= len(ranked):
+                tile.get_parent().set_visible(False)
+                continue
+            lang = ranked[i]
+            validated = lang.get("validatedHours", 0)
+            tile.get_parent().set_visible(True)
+            tile.update(f"#{i + 1} {lang.get('english_name', lang.get('locale', '?'))}",
+                        f"{validated:,.0f}h",
+                        f"{lang.get('recordedHours', 0):,.0f}h recorded",
+                        _cv_heatmap_class(validated))
+
+    def _rotate(self):
+        if self.stack.get_visible_child_name() not in ("loading", "error"):
+            self._view_index = (self._view_index + 1) % len(KIOSK_VIEWS)
+            self.stack.set_visible_child_name(KIOSK_VIEWS[self._view_index])
+        return GLib.SOURCE_CONTINUE
@@ -15,9 +15,11 @@ try:
 except (ValueError, ImportError):
     HAS_NOTIFY = False
 
-from gi.repository import Gtk, Adw, Gio
+from gi.repository import Gtk, Adw, Gio, GLib, Gdk
 
-from .notify import _send_notification, _load_notify_config, _save_notify_config
+from .notify import get_notify_config
+from .kiosk import KioskWindow
+from .model import LanguageModel
 from .window import CommonVoiceStatusWindow
 from .i18n import init_i18n
 
@@ -28,11 +30,13 @@ import platform as _platform
 from pathlib import Path as _Path
 
 _NOTIFY_APP = "commonvoice-status"
+_KIOSK_REFRESH_SECONDS = 15 * 60
+_KIOSK_RETRY_SECONDS = 60
 
 def _get_system_info():
     return "\n".join([
         f"App: Common Voice Status",
-        f"Version: {"0.1.1"}",
+        "Version: 0.1.1",
         f"GTK: {Gtk.get_major_version()}.{Gtk.get_minor_version()}.{Gtk.get_micro_version()}",
         f"Adw: {Adw.get_major_version()}.{Adw.get_minor_version()}.{Adw.get_micro_version()}",
         f"Python: {_platform.python_version()}",
@@ -43,9 +47,9 @@ class CommonVoiceStatusApp(Adw.Application):
     def __init__(self):
         super().__init__(
             application_id="se.danielnylander.CommonVoiceStatus",
-        GLib.set_application_name(_("Common Voice Status"))
             flags=Gio.ApplicationFlags.DEFAULT_FLAGS,
         )
+        GLib.set_application_name(_("Common Voice Status"))
         if HAS_NOTIFY:
             _Notify.init("commonvoice-status")
         about_action = Gio.SimpleAction.new("about", None)
@@ -58,9 +62,28 @@ class CommonVoiceStatusApp(Adw.Application):
         self.set_accels_for_action("app.export", ["<Control>e"])
 
         notif_action = Gio.SimpleAction.new("toggle-notifications", None)
-        notif_action.connect("activate", lambda *_: _save_notify_config({"enabled": not _load_notify_config().get("enabled", False)}))
+        notif_action.connect("activate", self._on_toggle_notifications)
         self.add_action(notif_action)
 
+        self.model = LanguageModel()
+        self.kiosk = False
+        self._kiosk_monitors = None
+        self._kiosk_windows = {}
+        self.add_main_option("kiosk", ord("k"), GLib.OptionFlags.NONE, GLib.OptionArg.NONE,
+                             _("Fullscreen wall-display mode, one window per monitor"), None)
+        self.add_main_option("corpus", ord("c"), GLib.OptionFlags.NONE, GLib.OptionArg.STRING,
+                             _("Compute statistics from a local Common Voice corpus directory"), "DIR")
+
+    def do_handle_local_options(self, options):
+        self.kiosk = options.contains("kiosk")
+        if options.contains("corpus"):
+            self.model.corpus_dir = options.lookup_value("corpus", GLib.VariantType.new("s")).get_string()
+        return -1
+
+    def _on_toggle_notifications(self, *_args):
+        config = get_notify_config()
+        config.set("enabled", not config.get("enabled"))
+
     def do_startup(self):
         Adw.Application.do_startup(self)
         self.set_accels_for_action("app.quit", ["<Control>q"])
@@ -72,9 +95,8 @@ class CommonVoiceStatusApp(Adw.Application):
             a = Gio.SimpleAction.new(n, None); a.connect("activate", cb); self.add_action(a)
 
     def _do_refresh(self):
-        w = self.get_active_window()
-        if w and hasattr(w, '_load_data'): w._load_data(force=True)
-        elif w and hasattr(w, '_on_refresh'): w._on_refresh(None)
+        # Every window follows the shared model, so one fetch updates them all
+        self.model.load(force=True)
 
     def _show_shortcuts_window(self, *_args):
         win = Gtk.ShortcutsWindow(transient_for=self.get_active_window(), modal=True)
@@ -88,11 +110,57 @@ class CommonVoiceStatusApp(Adw.Application):
         win.present()
 
     def do_activate(self):
+        if self.kiosk:
+            self._present_kiosk()
+            return
         win = self.props.active_window
         if not win:
             win = CommonVoiceStatusWindow(application=self)
         win.present()
 
+    def _present_kiosk(self):
+        if self._kiosk_monitors is not None:
+            for win in self._kiosk_windows.values():
+                win.present()
+            return
+        self._kiosk_monitors = Gdk.Display.get_default().get_monitors()
+        self._kiosk_monitors.connect("items-changed", self._sync_kiosk_windows)
+        # Keep running while every monitor is unplugged
+        self.hold()
+        self._sync_kiosk_windows()
+        self.model.connect("error", self._on_kiosk_error)
+        self.model.load()
+        GLib.timeout_add_seconds(_KIOSK_REFRESH_SECONDS, self._on_kiosk_refresh)
+
+    def _sync_kiosk_windows(self, *_args):
+        """Give every connected monitor one kiosk window, and no more."""
+        monitors = [self._kiosk_monitors.get_item(i) for i in range(self._kiosk_monitors.get_n_items())]
+        for monitor in list(self._kiosk_windows):
+            if monitor not in monitors:
+                self._kiosk_windows.pop(monitor).destroy()
+        for i, monitor in enumerate(monitors):
+            if monitor not in self._kiosk_windows:
+                win = KioskWindow(self.model, monitor=monitor, start_view=i, application=self)
+                win.connect("destroy", self._on_kiosk_window_destroyed, monitor)
+                self._kiosk_windows[monitor] = win
+                win.present()
+
+    def _on_kiosk_window_destroyed(self, win, monitor):
+        if self._kiosk_windows.get(monitor) is win:
+            del self._kiosk_windows[monitor]
+
+    def _on_kiosk_refresh(self):
+        self.model.load(force=True)
+        return GLib.SOURCE_CONTINUE
+
+    def _on_kiosk_error(self, _model, _message):
+        # Don't leave a wall display on an error until the next scheduled refresh
+        GLib.timeout_add_seconds(_KIOSK_RETRY_SECONDS, self._on_kiosk_retry)
+
+    def _on_kiosk_retry(self):
+        self.model.load(force=True)
+        return GLib.SOURCE_REMOVE
+
     def _on_about(self, *_args):
         about = Adw.AboutDialog(
             application_name=_("Common Voice Status"),
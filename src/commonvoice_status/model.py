@@ -0,0 +1,165 @@
+"""Shared language statistics model, one per application."""
+
+import threading
+
+from gi.repository import GLib, GObject
+
+from .api import ConnectionPool, fetch_languages, fetch_locale_details, next_milestone
+from .corpus import ingest_corpus
+from .notify import _send_notification
+from .i18n import _
+
+
+# Nordic + common comparison languages
+DEFAULT_COMPARE = ["sv", "no", "da", "fi", "nb-NO", "nn-NO"]
+DEFAULT_LOCALE = "sv-SE"
+
+
+class LanguageModel(GObject.Object):
+    """Fetch the language list once and tell every window when it changes.
+
+    With corpus_dir set the list is computed from a local corpus release
+    instead of the stats API.
+    """
+
+    __gsignals__ = {
+        "loading": (GObject.SignalFlags.RUN_FIRST, None, ()),
+        "changed": (GObject.SignalFlags.RUN_FIRST, None, ()),
+        "error": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
+        "detail-changed": (GObject.SignalFlags.RUN_FIRST, None, (str, str)),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.languages = []
+        self.details = {}
+        self.corpus_dir = None
+        self._loading = False
+        # A forced refresh asked for while a fetch was running
+        self._pending_force = False
+        self._detail_thread = None
+        self._pending_detail_force = False
+        # Kept for the model's lifetime so refreshes reuse keep-alive connections
+        self._pool = ConnectionPool()
+
+    def load(self, force=False):
+        """Start a fetch unless one is already running.
+
+        A forced load asked for during a fetch runs once that fetch ends.
+        """
+        if self._loading:
+            self._pending_force = self._pending_force or force
+            return
+        self._loading = True
+        self.emit("loading")
+
+        def worker():
+            try:
+                if self.corpus_dir:
+                    data = ingest_corpus(self.corpus_dir)
+                else:
+                    data = fetch_languages(force_refresh=force)
+                GLib.idle_add(self._on_loaded, data, force)
+            except Exception as e:
+                GLib.idle_add(self._on_error, str(e))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_loaded(self, data, force):
+        self._loading = False
+        self.set_languages(data, force=force)
+        self._run_pending_load()
+
+    def _on_error(self, message):
+        self._loading = False
+        self.emit("error", message)
+        self._run_pending_load()
+
+    def _run_pending_load(self):
+        if self._pending_force:
+            self._pending_force = False
+            self.load(force=True)
+
+    def set_languages(self, data, force=False):
+        self._notify_milestones(self.languages, data)
+        self.languages = data
+        self.emit("changed")
+        self.load_details(force=force)
+
+    def selected_language(self, locale_code=DEFAULT_LOCALE):
+        for lang in self.languages:
+            if lang.get("locale") == locale_code or lang.get("locale", "").startswith("sv"):
+                return lang
+        # fallback: first language
+        return self.languages[0] if self.languages else None
+
+    def comparison_languages(self):
+        compare_locales = DEFAULT_COMPARE
+        found = []
+        for lang in self.languages:
+            loc = lang.get("locale", "")
+            if loc in compare_locales or loc.split("-")[0] in [c.split("-")[0] for c in compare_locales]:
+                found.append(lang)
+
+        found.sort(key=lambda l: l.get("validatedHours", 0), reverse=True)
+        return found
+
+    def load_details(self, force=False):
+        """Fetch per-locale details for the featured and comparison locales."""
+        if self.corpus_dir:
+            # Local corpus figures have no matching API details
+            return
+        selected = self.selected_language()
+        locales = [l.get("locale") for l in self.comparison_languages()]
+        if selected and selected.get("locale") not in locales:
+            locales.insert(0, selected.get("locale"))
+        if not locales:
+            return
+        # Don't pile up fetch threads when refreshes come faster than details
+        if self._detail_thread is not None and self._detail_thread.is_alive():
+            self._pending_detail_force = self._pending_detail_force or force
+            return
+
+        def on_result(locale_code, name, data):
+            GLib.idle_add(self._on_detail_loaded, locale_code, name, data)
+
+        def worker():
+            try:
+                fetch_locale_details(locales, on_result=on_result, force_refresh=force, pool=self._pool)
+            finally:
+                GLib.idle_add(self._on_details_done)
+
+        self._detail_thread = threading.Thread(target=worker, daemon=True)
+        self._detail_thread.start()
+
+    def _on_details_done(self):
+        if self._detail_thread is not None and self._detail_thread.is_alive():
+            # Ran before the thread finished exiting; try again shortly
+            return GLib.SOURCE_CONTINUE
+        if self._pending_detail_force:
+            self._pending_detail_force = False
+            self.load_details(force=True)
+        return GLib.SOURCE_REMOVE
+
+    def _on_detail_loaded(self, locale_code, name, data):
+        if data is None:
+            return
+        self.details.setdefault(locale_code, {})[name] = data
+        self.emit("detail-changed", locale_code, name)
+
+    def _notify_milestones(self, old, new):
+        """Queue a notification for each locale that passed a milestone."""
+        if not old:
+            return
+        previous = {l.get("locale"): l.get("validatedHours", 0) for l in old}
+        for lang in new:
+            locale_code = lang.get("locale")
+            if locale_code not in previous:
+                continue
+            before, _rem = next_milestone(previous[locale_code])
+            after, _rem = next_milestone(lang.get("validatedHours", 0))
+            if before is not None and before != after:
+                name = lang.get("english_name", locale_code)
+                _send_notification(
+                    _("{} reached {} validated hours").format(name, f"{before:,}"),
+                    locale=locale_code)
@@ -1,6 +1,11 @@
 """Desktop notification helper."""
 
 import json as _json
+import os as _os
+import queue as _queue
+import threading as _threading
+import time as _time
+from datetime import datetime as _datetime
 from pathlib import Path as _Path
 
 try:
@@ -12,6 +17,24 @@ except (ValueError, ImportError):
     HAS_NOTIFY = False
     _Notify = None
 
+try:
+    from gi.repository import Gio as _Gio
+except ImportError:
+    _Gio = None
+
+from .i18n import _
+
+# Defaults for every key in notifications.json
+DEFAULT_NOTIFY_CONFIG = {
+    "enabled": True,
+    "watched_locales": [],  # empty means all locales
+    "quiet_hours": None,  # [start_hour, end_hour], e.g. [22, 7]
+    "min_interval": 60,  # seconds between two notifications
+}
+
+# How long the queue waits for more events before sending a batch
+BATCH_WINDOW = 2.0
+
 
 def _notify_config_path():
     return _Path.home() / ".config" / "commonvoice-status" / "notifications.json"
@@ -30,13 +53,169 @@ def _load_notify_config():
 def _save_notify_config(config):
     p = _notify_config_path()
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(_json.dumps(config))
+    # Write then rename, so the file monitor never sees a half-written file
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(_json.dumps(config))
+    _os.replace(tmp, p)
+
+
+def _is_hour(value):
+    return isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 23
+
+
+def _validate_notify_config(raw):
+    """Return a full config, using the default for every missing or invalid key."""
+    values = dict(DEFAULT_NOTIFY_CONFIG)
+    if not isinstance(raw, dict):
+        return values
+    enabled = raw.get("enabled")
+    if isinstance(enabled, (bool, int)):
+        values["enabled"] = bool(enabled)
+    watched = raw.get("watched_locales")
+    if isinstance(watched, list) and all(isinstance(l, str) for l in watched):
+        values["watched_locales"] = list(watched)
+    quiet = raw.get("quiet_hours")
+    if quiet is None or (isinstance(quiet, list) and len(quiet) == 2 and all(_is_hour(h) for h in quiet)):
+        values["quiet_hours"] = quiet
+    interval = raw.get("min_interval")
+    if isinstance(interval, (int, float)) and not isinstance(interval, bool) and interval >= 0:
+        values["min_interval"] = interval
+    # Keep unknown keys so saving doesn't drop them
+    for key, value in raw.items():
+        values.setdefault(key, value)
+    return values
 
 
-def _send_notification(summary, body="", icon="dialog-information"):
-    if HAS_NOTIFY and _load_notify_config().get("enabled"):
+class NotifyConfig:
+    """In-memory notification settings, reloaded when the file changes."""
+
+    def __init__(self):
+        self._lock = _threading.Lock()
+        self._values = {}
+        self._monitor = None
+        self.reload()
+        self._watch()
+
+    def _watch(self):
+        if _Gio is None:
+            return
+        try:
+            gfile = _Gio.File.new_for_path(str(_notify_config_path()))
+            self._monitor = gfile.monitor_file(_Gio.FileMonitorFlags.NONE, None)
+            self._monitor.connect("changed", self._on_file_changed)
+        except Exception:
+            self._monitor = None
+
+    def _on_file_changed(self, _monitor, _file, _other, event):
+        if event in (_Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+                     _Gio.FileMonitorEvent.DELETED):
+            self.reload()
+
+    def reload(self):
+        values = _validate_notify_config(_load_notify_config())
+        with self._lock:
+            self._values = values
+
+    def get(self, key):
+        with self._lock:
+            return self._values.get(key, DEFAULT_NOTIFY_CONFIG.get(key))
+
+    def set(self, key, value):
+        """Update one key and write the whole config back, keeping other keys."""
+        with self._lock:
+            self._values[key] = value
+            values = dict(self._values)
+        _save_notify_config(values)
+
+    def in_quiet_hours(self, now=None):
+        hours = self.get("quiet_hours")
+        if not hours or len(hours) != 2:
+            return False
+        start, end = hours
+        hour = (now or _datetime.now()).hour
+        if start <= end:
+            return start <= hour < end
+        return hour >= start or hour < end
+
+    def wants(self, locale):
+        if not self.get("enabled") or self.in_quiet_hours():
+            return False
+        watched = self.get("watched_locales")
+        return not watched or locale is None or locale in watched
+
+
+class NotificationQueue:
+    """Batch and rate-limit notifications, showing them from a worker thread."""
+
+    def __init__(self, config):
+        self.config = config
+        self._queue = _queue.Queue()
+        self._last_sent = 0.0
+        self._thread = _threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def push(self, summary, body="", icon="dialog-information", locale=None):
+        if HAS_NOTIFY and self.config.wants(locale):
+            self._queue.put((summary, body, icon))
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        wait_until = max(_time.monotonic() + BATCH_WINDOW,
+                         self._last_sent + self.config.get("min_interval"))
+        while True:
+            timeout = wait_until - _time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except _queue.Empty:
+                break
+        return batch
+
+    def _worker(self):
+        while True:
+            # One bad batch must not kill the only thread that shows notifications
+            try:
+                self._send_batch(self._collect())
+            except Exception:
+                pass
+            self._last_sent = _time.monotonic()
+
+    def _send_batch(self, batch):
+        if len(batch) == 1:
+            summary, body, icon = batch[0]
+        else:
+            summary = _("{} Common Voice updates").format(len(batch))
+            body = "\n".join(s for s, _b, _i in batch)
+            icon = "dialog-information"
+        self._show(summary, body, icon)
+
+    def _show(self, summary, body, icon):
         try:
             n = _Notify.Notification.new(summary, body, icon)
             n.show()
         except Exception:
             pass
+
+
+_config = None
+_notify_queue = None
+
+
+def get_notify_config():
+    """Return the shared notification config, creating it on first use."""
+    global _config
+    if _config is None:
+        _config = NotifyConfig()
+    return _config
+
+
+def _get_notify_queue():
+    global _notify_queue
+    if _notify_queue is None:
+        _notify_queue = NotificationQueue(get_notify_config())
+    return _notify_queue
+
+
+def _send_notification(summary, body="", icon="dialog-information", locale=None):
+    _get_notify_queue().push(summary, body, icon, locale=locale)
@@ -0,0 +1,228 @@
+"""Soak test: drive refresh/sort/populate cycles and watch memory growth.
+
+Run headlessly, e.g.:
+
+    xvfb-run python -m commonvoice_status.soak --cycles 5000
+
+The window talks to a local stand-in for the Common Voice API, so no
+network access is needed. GObject instance counts need
+GOBJECT_DEBUG=instance-count before GObject starts; when run as a
+script the harness restarts itself with it set. Exits non-zero if
+growth exceeds the limits.
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+if __name__ == "__main__" and "instance-count" not in os.environ.get("GOBJECT_DEBUG", ""):
+    os.environ["GOBJECT_DEBUG"] = ",".join(filter(None, [os.environ.get("GOBJECT_DEBUG"), "instance-count"]))
+    os.execv(sys.executable, [sys.executable, "-m", "commonvoice_status.soak"] + sys.argv[1:])
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+
+from gi.repository import Adw, Gtk, GLib, GObject
+
+from . import api, notify
+from .window import CommonVoiceStatusWindow, SORT_RECORDED, SORT_SPEAKERS, SORT_VALIDATED
+
+SORT_MODES = [SORT_VALIDATED, SORT_RECORDED, SORT_SPEAKERS]
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Serve synthetic language stats that drift a little on every request."""
+
+    protocol_version = "HTTP/1.1"
+    locales = ["sv-SE", "da", "fi", "nb-NO", "nn-NO", "is", "en", "de", "fr", "es"] + \
+        [f"x{i:02d}" for i in range(90)]
+
+    def do_GET(self):
+        if self.path.startswith("/api/v1/stats/languages"):
+            data = [{
+                "locale": loc,
+                "english_name": loc.upper(),
+                "recordedHours": random.uniform(0, 3000),
+                "validatedHours": random.uniform(0, 2500),
+                "invalidatedHours": random.uniform(0, 100),
+                "speakersCount": random.randint(0, 100000),
+                "sentencesCount": {"currentCount": random.randint(0, 500000)},
+            } for loc in self.locales]
+        elif "contribution_activity" in self.path:
+            data = [{"date": f"2026-01-{d:02d}", "value": random.randint(0, 500)} for d in range(1, 15)]
+        else:
+            data = random.randint(0, 5000)
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+def _start_stand_in():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _point_api_at(base_url, cache_dir):
+    api.API_URL = f"{base_url}/api/v1/stats/languages"
+    api.API_BASE = base_url
+    api.CACHE_DIR = cache_dir
+    api.CACHE_FILE = cache_dir / "languages.json"
+    api.DETAIL_CACHE_DIR = cache_dir / "details"
+
+
+def _rss_kb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # Peak rather than current RSS, but still catches runaway growth
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _gobject_counts():
+    """Live C instances of the types _populate creates, wrapped or not."""
+    return {cls.__gtype__.name: GObject.type_get_instance_count(cls.__gtype__)
+            for cls in (Gtk.Box, Gtk.Label, Gtk.GestureClick, Gtk.FlowBoxChild, Adw.ActionRow)}
+
+
+def _settle(win, timeout=10.0, frames=2):
+    """Run the main loop until pending work and detail fetches are done,
+    then until the window has drawn a few more frames."""
+    ctx = GLib.MainContext.default()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        while ctx.pending():
+            ctx.iteration(False)
+        thread = win.model._detail_thread
+        if (thread is None or not thread.is_alive()) and not ctx.pending():
+            break
+        time.sleep(0.005)
+
+    # Layout, CSS and render nodes are only built when a frame is drawn
+    ticks = []
+
+    def on_tick(_widget, _clock):
+        ticks.append(None)
+        return GLib.SOURCE_CONTINUE if len(ticks) < frames else GLib.SOURCE_REMOVE
+
+    win.add_tick_callback(on_tick)
+    while len(ticks) < frames and time.monotonic() < deadline:
+        ctx.iteration(True)
+
+
+def _measure(win):
+    _settle(win)
+    gc.collect()
+    return {
+        "snapshot": tracemalloc.take_snapshot(),
+        "gobjects": _gobject_counts(),
+        "rss_kb": _rss_kb(),
+    }
+
+
+def run(cycles, warmup, max_py_kb, max_rss_kb, max_gobjects, report_every):
+    """Run the soak loop and return a list of threshold violations."""
+    if "instance-count" not in os.environ.get("GOBJECT_DEBUG", ""):
+        raise RuntimeError("GObject instance counts need GOBJECT_DEBUG=instance-count")
+    server = _start_stand_in()
+    cache = tempfile.TemporaryDirectory(prefix="cv-soak-")
+    _point_api_at(f"http://127.0.0.1:{server.server_port}", Path(cache.name))
+    # Random data crosses milestones constantly; keep the desktop quiet
+    notify.HAS_NOTIFY = False
+
+    Adw.init()
+    win = CommonVoiceStatusWindow()
+    # Mapped widgets get cursors, CSS nodes and render nodes; unmapped ones don't
+    win.present()
+
+    def cycle(i):
+        win.model.set_languages(api.fetch_languages(force_refresh=True), force=True)
+        for mode in SORT_MODES:
+            win.sort_mode = mode
+            win._populate()
+        _settle(win)
+
+    tracemalloc.start(25)
+    for i in range(warmup):
+        cycle(i)
+    base = _measure(win)
+
+    for i in range(cycles):
+        cycle(i)
+        if report_every and (i + 1) % report_every == 0:
+            print(f"{i + 1}/{cycles} cycles, RSS {_rss_kb() / 1024:.1f} MiB", flush=True)
+
+    end = _measure(win)
+    tracemalloc.stop()
+
+    stats = end["snapshot"].compare_to(base["snapshot"], "lineno")
+    py_growth_kb = sum(s.size_diff for s in stats) / 1024
+    rss_growth_kb = end["rss_kb"] - base["rss_kb"]
+    gobject_growth = {name: count - base["gobjects"].get(name, 0)
+                      for name, count in end["gobjects"].items()
+                      if count > base["gobjects"].get(name, 0)}
+
+    print(f"Python heap growth: {py_growth_kb:.1f} KiB")
+    for s in stats[:10]:
+        if s.size_diff > 0:
+            print(f"  {s}")
+    print(f"RSS growth: {rss_growth_kb / 1024:.1f} MiB")
+    print(f"GObject instance growth: {sum(gobject_growth.values())}")
+    for name, diff in sorted(gobject_growth.items(), key=lambda kv: -kv[1])[:10]:
+        print(f"  {name}: +{diff}")
+
+    failures = []
+    if py_growth_kb > max_py_kb:
+        failures.append(f"Python heap grew {py_growth_kb:.1f} KiB (limit {max_py_kb} KiB)")
+    if rss_growth_kb > max_rss_kb:
+        failures.append(f"RSS grew {rss_growth_kb} KiB (limit {max_rss_kb} KiB)")
+    if sum(gobject_growth.values()) > max_gobjects:
+        failures.append(f"{sum(gobject_growth.values())} more live GObjects (limit {max_gobjects})")
+
+    win.destroy()
+    server.shutdown()
+    cache.cleanup()
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memory soak test for Common Voice Status")
+    parser.add_argument("--cycles", type=int, default=2000, help="refresh/sort/populate cycles to run")
+    parser.add_argument("--warmup", type=int, default=20, help="cycles before the baseline is taken")
+    parser.add_argument("--max-py-kb", type=int, default=512, help="allowed Python heap growth (KiB)")
+    parser.add_argument("--max-rss-kb", type=int, default=16384, help="allowed RSS growth (KiB)")
+    parser.add_argument("--max-gobjects", type=int, default=50, help="allowed growth in live GObject instances")
+    parser.add_argument("--report-every", type=int, default=500, help="print progress every N cycles")
+    args = parser.parse_args(argv)
+
+    failures = run(args.cycles, args.warmup, args.max_py_kb, args.max_rss_kb,
+                   args.max_gobjects, args.report_every)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,6 @@
 
 import csv
 import json
-import threading
 import webbrowser
 
 from datetime import datetime as _dt_now
@@ -13,20 +12,23 @@ gi.require_version("Adw", "1")
 
 from gi.repository import Adw, Gtk, GLib, Gio, Pango, Gdk
 
-from .api import fetch_languages, next_milestone
-from .notify import _send_notification
+from .api import next_milestone
+from .model import DEFAULT_LOCALE, LanguageModel
 from .i18n import _
 
-
-# Nordic + common comparison languages
-DEFAULT_COMPARE = ["sv", "no", "da", "fi", "nb-NO", "nn-NO"]
-DEFAULT_LOCALE = "sv-SE"
-
 # Milestones for validated hours coloring
 _CV_MILESTONES = [10, 50, 100, 500, 1000, 5000]
 
 
+_css_displays = set()
+
+
 def _setup_heatmap_css():
+    # Install the provider once per display, not once per window
+    display = Gdk.Display.get_default()
+    if display is None or display.get_name() in _css_displays:
+        return
+    _css_displays.add(display.get_name())
     css = b"""
     .heatmap-green { background-color: #26a269; color: white; border-radius: 8px; }
     .heatmap-yellow { background-color: #e5a50a; color: white; border-radius: 8px; }
@@ -37,7 +39,7 @@ def _setup_heatmap_css():
     provider = Gtk.CssProvider()
     provider.load_from_data(css)
     Gtk.StyleContext.add_provider_for_display(
-        Gdk.Display.get_default(), provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        display, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
 
 
 def _cv_heatmap_class(validated_hours):
@@ -52,24 +54,74 @@ def _cv_heatmap_class(validated_hours):
         return "heatmap-red"
     return "heatmap-gray"
 
+def _detail_labels():
+    return {
+        "clips_today": _("Clips recorded today"),
+        "votes_today": _("Clips validated today"),
+        "activity": _("Contributions, last 7 days"),
+    }
+
+
+def _format_detail(name, data):
+    """Format one detail endpoint result for display."""
+    if name == "activity" and isinstance(data, list):
+        return f"{sum(d.get('value', 0) for d in data[-7:]):,}"
+    if isinstance(data, (int, float)):
+        return f"{data:,}"
+    return str(data)
+
+
+def _detail_tooltip(locale_details):
+    labels = _detail_labels()
+    lines = [f"{labels[name]}: {_format_detail(name, data)}"
+             for name, data in locale_details.items() if name in labels]
+    return "\n" + "\n".join(lines) if lines else ""
+
 SORT_RECORDED = "recorded"
 SORT_VALIDATED = "validated"
 SORT_SPEAKERS = "speakers"
 
 
 class CommonVoiceStatusWindow(Adw.ApplicationWindow):
-    def __init__(self, **kwargs):
+    def __init__(self, model=None, **kwargs):
         super().__init__(**kwargs)
         self.set_title(_("Common Voice Status"))
         self.set_default_size(900, 700)
 
-        self.languages = []
+        # Windows of one application share its model and its fetches
+        app = self.get_application()
+        self.model = model or getattr(app, "model", None) or LanguageModel()
+        self._detail_rows = {}
+        self._compare_tiles = {}
         self.selected_locale = DEFAULT_LOCALE
         self.sort_mode = SORT_VALIDATED
 
         _setup_heatmap_css()
         self._build_ui()
-        self._load_data()
+        self._model_handlers = [
+            self.model.connect("loading", self._on_data_loading),
+            self.model.connect("changed", self._on_data_loaded),
+            self.model.connect("error", self._on_data_error),
+            self.model.connect("detail-changed", self._on_detail_loaded),
+        ]
+        self.connect("destroy", self._on_destroy)
+        if self.model.languages:
+            self._on_data_loaded(self.model)
+        else:
+            self._load_data()
+
+    @property
+    def languages(self):
+        return self.model.languages
+
+    @property
+    def details(self):
+        return self.model.details
+
+    def _on_destroy(self, _win):
+        for handler in self._model_handlers:
+            self.model.disconnect(handler)
+        self._model_handlers = []
 
     def _build_ui(self):
         # Header bar
@@ -153,25 +205,27 @@ class CommonVoiceStatusWindow(Adw.ApplicationWindow):
         self.stack.set_visible_child_name("loading")
 
     def _load_data(self, force=False):
-        self.stack.set_visible_child_name("loading")
+        self.model.load(force=force)
 
-        def worker():
-            try:
-                data = fetch_languages(force_refresh=force)
-                GLib.idle_add(self._on_data_loaded, data)
-            except Exception as e:
-                GLib.idle_add(self._on_data_error, str(e))
-
-        threading.Thread(target=worker, daemon=True).start()
+    def _on_data_loading(self, _model):
+        self.stack.set_visible_child_name("loading")
 
-    def _on_data_loaded(self, data):
-        self.languages = data
+    def _on_data_loaded(self, _model):
         self._populate()
         self.stack.set_visible_child_name("content")
         self._update_status_bar()
 
-
-    def _on_data_error(self, message):
+    def _on_detail_loaded(self, _model, locale_code, name):
+        data = self.details[locale_code][name]
+        row = self._detail_rows.get((locale_code, name))
+        if row is not None:
+            row.set_subtitle(_format_detail(name, data))
+        tile = self._compare_tiles.get(locale_code)
+        if tile is not None:
+            box, tooltip = tile
+            box.set_tooltip_text(tooltip + _detail_tooltip(self.details[locale_code]))
+
+    def _on_data_error(self, _model, message):
         self.error_status.set_description(message)
         self.stack.set_visible_child_name("error")
 
@@ -191,7 +245,9 @@ class CommonVoiceStatusWindow(Adw.ApplicationWindow):
         return sorted(self.languages, key=key_map.get(self.sort_mode, key_map[SORT_VALIDATED]), reverse=True)
 
     def _populate(self):
-        # Clear
+        # Clear, dropping references to the old widgets as well
+        self._detail_rows = {}
+        self._compare_tiles = {}
         child = self.content_box.get_first_child()
         while child:
             next_child = child.get_next_sibling()
@@ -202,14 +258,7 @@ class CommonVoiceStatusWindow(Adw.ApplicationWindow):
             return
 
         # Find selected language for feature card
-        selected = None
-        for lang in self.languages:
-            if lang.get("locale") == self.selected_locale or lang.get("locale", "").startswith("sv"):
-                selected = lang
-                break
-        if not selected:
-            # fallback: first language
-            selected = self.languages[0] if self.languages else None
+        selected = self.model.selected_language(self.selected_locale)
 
         # Featured language card
         if selected:
@@ -294,6 +343,17 @@ class CommonVoiceStatusWindow(Adw.ApplicationWindow):
 
         self.content_box.append(group)
 
+        # Per-locale activity, filled in as detail requests complete
+        activity = Adw.PreferencesGroup(title=_("Activity"))
+        locale_details = self.details.get(locale_code, {})
+        for name, label in _detail_labels().items():
+            value = locale_details.get(name)
+            row = Adw.ActionRow(title=label,
+                                subtitle=_format_detail(name, value) if value is not None else "…")
+            activity.add(row)
+            self._detail_rows[(locale_code, name)] = row
+        self.content_box.append(activity)
+
     def _add_gap_card(self, lang):
         validated = lang.get("validatedHours", 0)
         milestone, remaining = next_milestone(validated)
@@ -323,14 +383,7 @@ class CommonVoiceStatusWindow(Adw.ApplicationWindow):
         label.set_margin_top(8)
         self.content_box.append(label)
 
-        compare_locales = DEFAULT_COMPARE
-        found = []
-        for lang in self.languages:
-            loc = lang.get("locale", "")
-            if loc in compare_locales or loc.split("-")[0] in [c.split("-")[0] for c in compare_locales]:
-                found.append(lang)
-
-        found.sort(key=lambda l: l.get("validatedHours", 0), reverse=True)
+        found = self.model.comparison_languages()
 
         if found:
             flow = Gtk.FlowBox()
@@ -371,8 +424,10 @@ class CommonVoiceStatusWindow(Adw.ApplicationWindow):
                 spk_lbl.set_margin_bottom(6)
                 box.append(spk_lbl)
 
-                box.set_tooltip_text(f"{name}: {recorded:.0f}h recorded, {validated:.0f}h validated")
+                tooltip = f"{name}: {recorded:.0f}h recorded, {validated:.0f}h validated"
                 locale_code = lang.get("locale", "en")
+                box.set_tooltip_text(tooltip + _detail_tooltip(self.details.get(locale_code, {})))
+                self._compare_tiles[locale_code] = (box, tooltip)
                 gesture = Gtk.GestureClick()
                 gesture.connect("released", lambda g, n, x, y, lc=locale_code: webbrowser.open(f"https://commonvoice.mozilla.org/{lc}"))
                 box.add_controller(gesture)
@@ -0,0 +1,119 @@
+"""Per-locale detail fetching against a local stand-in server."""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from commonvoice_status import api
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        self.server.paths.append(self.path)
+        if self.path.endswith("drop"):
+            # Answer as keep-alive, then hang up anyway
+            self.close_connection = True
+        status = 500 if self.path.startswith("/api/v1/broken/") else 200
+        body = json.dumps(7).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.connections = set()
+    httpd.paths = []
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def pool(server):
+    pool = api.ConnectionPool(f"http://127.0.0.1:{server.server_port}")
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(autouse=True)
+def detail_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "DETAIL_CACHE_DIR", tmp_path / "details")
+    return tmp_path / "details"
+
+
+def test_connections_are_reused(server, pool):
+    locales = [f"l{i}" for i in range(20)]
+    seen = []
+    results = api.fetch_locale_details(locales, on_result=lambda *r: seen.append(r),
+                                       force_refresh=True, pool=pool)
+
+    assert len(server.paths) == len(locales) * len(api.DETAIL_ENDPOINTS)
+    assert len(server.connections) <= api.DETAIL_WORKERS
+    assert {(loc, name) for loc, name, _data in seen} == \
+        {(loc, name) for loc in locales for name in api.DETAIL_ENDPOINTS}
+    assert all(results[loc][name] == 7 for loc in locales for name in api.DETAIL_ENDPOINTS)
+
+
+def test_pool_persists_across_fetches(server, pool):
+    locales = [f"l{i}" for i in range(20)]
+    api.fetch_locale_details(locales, force_refresh=True, pool=pool)
+    api.fetch_locale_details(locales, force_refresh=True, pool=pool)
+
+    # A pool per fetch would need new connections for the second round
+    assert len(server.connections) <= api.DETAIL_WORKERS
+
+
+def test_server_error_becomes_none(server, pool):
+    seen = []
+    results = api.fetch_locale_details(["broken"], on_result=lambda *r: seen.append(r), pool=pool)
+
+    assert results["broken"] == {name: None for name in api.DETAIL_ENDPOINTS}
+    assert sorted(seen) == sorted(("broken", name, None) for name in api.DETAIL_ENDPOINTS)
+
+
+def test_per_endpoint_ttl(server, pool, detail_cache):
+    api.fetch_locale_details(["sv-SE"], pool=pool)
+    assert len(server.paths) == len(api.DETAIL_ENDPOINTS)
+
+    # Everything is fresh: no requests
+    api.fetch_locale_details(["sv-SE"], pool=pool)
+    assert len(server.paths) == len(api.DETAIL_ENDPOINTS)
+
+    # Age every cache file past the shortest TTL but within the longest
+    short = min(ttl for _path, ttl in api.DETAIL_ENDPOINTS.values())
+    long = max(ttl for _path, ttl in api.DETAIL_ENDPOINTS.values())
+    assert short < long
+    old = time.time() - (short + long) / 2
+    for f in detail_cache.iterdir():
+        os.utime(f, (old, old))
+    del server.paths[:]
+    api.fetch_locale_details(["sv-SE"], pool=pool)
+
+    expired = {path.format(locale="sv-SE") for path, ttl in api.DETAIL_ENDPOINTS.values() if ttl == short}
+    assert set(server.paths) == expired
+
+
+def test_stale_idle_connections_are_replaced(server, pool):
+    # Two idle connections the server has already closed
+    for _i in range(2):
+        conn = pool._new_connection()
+        conn.request("GET", "/drop")
+        conn.getresponse().read()
+        pool._release(conn)
+
+    assert pool.get_json("/api/v1/sv-SE/clips/daily_count") == 7
@@ -0,0 +1,79 @@
+"""Statistics computed from a small local corpus."""
+
+import json
+
+import pytest
+
+from commonvoice_status import api, corpus
+
+
+def _write_tsv(path, header, rows):
+    path.write_text("\n".join(["\t".join(header)] + ["\t".join(map(str, r)) for r in rows]) + "\n")
+
+
+def _make_corpus(root, locale="sv-SE"):
+    d = root / locale
+    d.mkdir(parents=True)
+    _write_tsv(d / "clip_durations.tsv", ["clip", "duration[ms]"],
+               [("a.mp3", 3_600_000), ("b.mp3", 1_800_000), ("c.mp3", 900_000), ("d.mp3", 900_000)])
+    header = ["client_id", "path", "sentence_id", "sentence", "up_votes"]
+    _write_tsv(d / "validated.tsv", header, [("s1", "a.mp3", "x", "Hej", 2), ("s2", "b.mp3", "y", "Hallå", 2)])
+    _write_tsv(d / "invalidated.tsv", header, [("s1", "c.mp3", "x", "Hej", 0)])
+    _write_tsv(d / "other.tsv", header, [("s3", "d.mp3", "z", "Tja", 0)])
+    return d
+
+
+@pytest.fixture(autouse=True)
+def caches(tmp_path, monkeypatch):
+    monkeypatch.setattr(corpus, "CORPUS_CACHE_DIR", tmp_path / "cache" / "corpus")
+    monkeypatch.setattr(api, "CACHE_FILE", tmp_path / "cache" / "languages.json")
+
+
+def test_figures_match_the_api_shape(tmp_path):
+    locale_dir = _make_corpus(tmp_path / "release")
+
+    assert corpus._ingest_locale(locale_dir) == {
+        "locale": "sv-SE",
+        "english_name": "sv-SE",
+        "recordedHours": 2.0,
+        "validatedHours": 1.5,
+        "invalidatedHours": 0.25,
+        "speakersCount": 3,
+        "sentencesCount": {"currentCount": 2},
+    }
+
+
+def test_malformed_durations_are_skipped(tmp_path):
+    locale_dir = _make_corpus(tmp_path / "release")
+    with open(locale_dir / "clip_durations.tsv", "a") as f:
+        f.write("e.mp3\t\nf.mp3\tn/a\n")
+
+    assert corpus._ingest_locale(locale_dir)["recordedHours"] == 2.0
+
+
+def test_partitioned_join_gives_the_same_result(tmp_path, monkeypatch):
+    locale_dir = _make_corpus(tmp_path / "release")
+    single = corpus._ingest_locale(locale_dir)
+    monkeypatch.setattr(corpus, "MAX_JOIN_ENTRIES", 1)
+
+    assert corpus._ingest_locale(locale_dir) == single
+
+
+def test_names_come_from_the_cached_api_list(tmp_path):
+    _make_corpus(tmp_path / "release")
+    api.CACHE_FILE.parent.mkdir(parents=True)
+    api.CACHE_FILE.write_text(json.dumps([{"locale": "sv-SE", "english_name": "Swedish"}]))
+
+    [stats] = corpus.ingest_corpus(tmp_path / "release", workers=1)
+    assert stats["english_name"] == "Swedish"
+
+
+def test_releases_keep_separate_caches(tmp_path):
+    old = _make_corpus(tmp_path / "old")
+    new = _make_corpus(tmp_path / "new")
+    corpus.ingest_corpus(tmp_path / "old", workers=1)
+    corpus.ingest_corpus(tmp_path / "new", workers=1)
+
+    assert len(list(corpus.CORPUS_CACHE_DIR.iterdir())) == 2
+    assert corpus._read_corpus_cache(old, corpus._cache_key(old)) is not None
+    assert corpus._read_corpus_cache(new, corpus._cache_key(new)) is not None
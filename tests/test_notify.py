@@ -0,0 +1,154 @@
+"""Notification settings, quiet hours and the batching queue."""
+
+import json
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from commonvoice_status import notify
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "notifications.json"
+    monkeypatch.setattr(notify, "_notify_config_path", lambda: path)
+    return path
+
+
+def _config(config_file, **values):
+    config_file.write_text(json.dumps(values))
+    return notify.NotifyConfig()
+
+
+class _Recorder:
+    """Remembers every notification NotificationQueue._show would display."""
+
+    def __init__(self):
+        self.calls = []
+        self.sent = threading.Semaphore(0)
+
+    def show(self, summary, body, icon):
+        self.calls.append((time.monotonic(), summary, body))
+        self.sent.release()
+
+    def wait(self, count=1, timeout=5):
+        for _i in range(count):
+            assert self.sent.acquire(timeout=timeout)
+
+
+@pytest.fixture
+def shown(monkeypatch):
+    recorder = _Recorder()
+    monkeypatch.setattr(notify, "HAS_NOTIFY", True)
+    monkeypatch.setattr(notify, "BATCH_WINDOW", 0.2)
+    monkeypatch.setattr(notify.NotificationQueue, "_show",
+                        lambda _queue, summary, body, icon: recorder.show(summary, body, icon))
+    return recorder
+
+
+def test_valid_config_is_kept():
+    raw = {"enabled": False, "watched_locales": ["sv-SE"], "quiet_hours": [22, 7], "min_interval": 5}
+    assert notify._validate_notify_config(raw) == raw
+
+
+@pytest.mark.parametrize("key, value", [
+    ("enabled", "no"),
+    ("watched_locales", "sv-SE"),
+    ("watched_locales", ["sv-SE", 3]),
+    ("quiet_hours", [22]),
+    ("quiet_hours", [22, 24]),
+    ("quiet_hours", [True, 7]),
+    ("min_interval", -1),
+    ("min_interval", "60"),
+])
+def test_invalid_values_fall_back_to_the_default(key, value):
+    other, other_value = ("min_interval", 5) if key != "min_interval" else ("enabled", False)
+    values = notify._validate_notify_config({key: value, other: other_value})
+    assert values[key] == notify.DEFAULT_NOTIFY_CONFIG[key]
+    # One bad key doesn't throw away the good ones
+    assert values[other] == other_value
+
+
+def test_unknown_keys_and_non_dicts():
+    assert notify._validate_notify_config({"sound": "bell"})["sound"] == "bell"
+    assert notify._validate_notify_config(["enabled"]) == notify.DEFAULT_NOTIFY_CONFIG
+
+
+def test_set_saves_every_key(config_file):
+    config = _config(config_file, watched_locales=["da"], sound="bell")
+    config.set("enabled", False)
+
+    saved = json.loads(config_file.read_text())
+    assert saved["enabled"] is False
+    assert saved["watched_locales"] == ["da"]
+    assert saved["sound"] == "bell"
+
+
+@pytest.mark.parametrize("hour, quiet", [(23, True), (6, True), (7, False), (12, False), (22, True)])
+def test_quiet_hours_wrap_past_midnight(config_file, hour, quiet):
+    config = _config(config_file, quiet_hours=[22, 7])
+    assert config.in_quiet_hours(datetime(2026, 1, 1, hour)) is quiet
+
+
+def test_quiet_hours_within_a_day(config_file):
+    config = _config(config_file, quiet_hours=[9, 17])
+    assert config.in_quiet_hours(datetime(2026, 1, 1, 12))
+    assert not config.in_quiet_hours(datetime(2026, 1, 1, 18))
+
+
+def test_watched_locales(config_file):
+    config = _config(config_file, watched_locales=["sv-SE"])
+    assert config.wants("sv-SE")
+    assert not config.wants("da")
+    # Messages not about one locale always pass
+    assert config.wants(None)
+
+
+def test_disabled_wants_nothing(config_file):
+    config = _config(config_file, enabled=False)
+    assert not config.wants("sv-SE")
+
+
+def test_bursts_become_one_notification(config_file, shown):
+    queue = notify.NotificationQueue(_config(config_file, min_interval=0))
+    for i in range(5):
+        queue.push(f"Milestone {i}", locale="sv-SE")
+    shown.wait()
+    time.sleep(notify.BATCH_WINDOW * 2)
+
+    [(_when, summary, body)] = shown.calls
+    assert summary == "5 Common Voice updates"
+    assert body.splitlines() == [f"Milestone {i}" for i in range(5)]
+
+
+def test_single_event_is_shown_as_is(config_file, shown):
+    queue = notify.NotificationQueue(_config(config_file, min_interval=0))
+    queue.push("Milestone", "sv-SE passed 100 hours", locale="sv-SE")
+    shown.wait()
+
+    assert [(s, b) for _w, s, b in shown.calls] == [("Milestone", "sv-SE passed 100 hours")]
+
+
+def test_unwatched_locales_are_dropped(config_file, shown):
+    queue = notify.NotificationQueue(_config(config_file, watched_locales=["sv-SE"], min_interval=0))
+    queue.push("Danish", locale="da")
+    queue.push("Swedish", locale="sv-SE")
+    shown.wait()
+    time.sleep(notify.BATCH_WINDOW * 2)
+
+    assert [s for _w, s, _b in shown.calls] == ["Swedish"]
+
+
+def test_min_interval_spaces_notifications(config_file, shown):
+    queue = notify.NotificationQueue(_config(config_file, min_interval=1))
+    queue.push("First")
+    shown.wait()
+    queue.push("Second")
+    queue.push("Third")
+    shown.wait()
+
+    (first, _s1, _b1), (second, summary, _b2) = shown.calls
+    assert second - first >= 1
+    assert summary == "2 Common Voice updates"